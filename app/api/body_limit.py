@@ -0,0 +1,50 @@
+"""Request body size limit for the /query endpoints."""
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.dto.error_schema import ErrorResponse
+
+# Upper bound for a /query request body. QueryRequest.question is capped at
+# 1000 characters, which even fully \u-escaped plus the other fields stays
+# well below this, so anything larger can be rejected without validating it.
+MAX_QUERY_BODY_BYTES = 16 * 1024
+
+
+class PayloadTooLargeError(Exception):
+    """Raised when a request body exceeds MAX_QUERY_BODY_BYTES."""
+
+
+def payload_too_large_response() -> ORJSONResponse:
+    """Build the 413 response shared by the middleware and the dependency."""
+    return ORJSONResponse(
+        status_code=413,
+        content=ErrorResponse(
+            error="Payload Too Large",
+            message=f"Request body exceeds {MAX_QUERY_BODY_BYTES} bytes",
+        ).model_dump(),
+    )
+
+
+class QueryBodySizeLimitMiddleware:
+    """Reject /query requests whose Content-Length exceeds the limit.
+
+    Written as plain ASGI so every other route passes straight through
+    without the per-request overhead of BaseHTTPMiddleware. Bodies sent
+    without a Content-Length are capped by get_query_request instead.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/query"):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > MAX_QUERY_BODY_BYTES:
+                        response = payload_too_large_response()
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
@@ -1,5 +1,47 @@
 from fastapi import Request
-from omegaconf import DictConfig
+from fastapi.exceptions import RequestValidationError
+from app.dto.config import AppConfig
+from pydantic import ValidationError
 
-def get_cfg(request: Request) -> DictConfig:
-    return request.app.state.cfg
\ No newline at end of file
+from app.api.body_limit import MAX_QUERY_BODY_BYTES, PayloadTooLargeError
+from app.dto.query_schema import QueryRequest
+
+
+def get_cfg(request: Request) -> AppConfig:
+    return request.app.state.cfg
+
+
+async def get_query_request(request: Request) -> QueryRequest:
+    """Parse and validate the request body as a QueryRequest.
+
+    Validates the raw bytes with ``model_validate_json`` so pydantic-core
+    parses the JSON itself, instead of FastAPI decoding it into a dict
+    first and validating that.
+
+    Raises:
+        PayloadTooLargeError: If the body exceeds MAX_QUERY_BODY_BYTES
+        RequestValidationError: If the body is not a valid QueryRequest
+    """
+    # Read incrementally so an oversized (e.g. chunked) body is rejected
+    # without buffering all of it
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_QUERY_BODY_BYTES:
+            raise PayloadTooLargeError()
+        chunks.append(chunk)
+    body = b"".join(chunks)
+
+    try:
+        return QueryRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = []
+        for error in e.errors(include_url=False):
+            error = {**error, "loc": ("body", *error["loc"])}
+            if error["type"] == "json_invalid":
+                # The input here is the raw body bytes, which may not be
+                # valid UTF-8 and would break FastAPI's 422 encoding
+                error.pop("input", None)
+            errors.append(error)
+        raise RequestValidationError(errors, body=body)
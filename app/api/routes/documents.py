@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi import Depends
-from omegaconf import DictConfig
+from app.dto.config import AppConfig
 
 
 from app.dto.document_schema import (
@@ -11,8 +11,6 @@ from app.dto.document_schema import (
     DocumentUploadResponse
 )
 from app.dto.error_schema import ErrorResponse
-from app.core.document_processor import DocumentProcessor
-from app.core.vector_store import VectorStoreService
 from app.utils.logger import get_logger
 from app.api.dependencies import get_cfg
 
@@ -34,7 +32,7 @@ router = APIRouter(prefix="/documents", tags=["Documents"])
 )
 async def upload_document(
     file: UploadFile = File(..., description="Document file to upload"),
-    cfg: DictConfig = Depends(get_cfg),
+    cfg: AppConfig = Depends(get_cfg),
 ) -> DocumentUploadResponse:
     
     """Upload and process a document."""        
@@ -47,7 +45,9 @@ async def upload_document(
         )
     
     try:
-        
+        from app.core.document_processor import DocumentProcessor
+        from app.core.vector_store import VectorStoreService
+
         processor = DocumentProcessor(cfg)
         chunks = processor.process_upload(file.file, file.filename)
 
@@ -91,12 +91,14 @@ async def upload_document(
     description="Get information about the document collection"
 )
 async def get_collection_info(
-     cfg: DictConfig = Depends(get_cfg),
+     cfg: AppConfig = Depends(get_cfg),
 ) -> DocumentListResponse:
     """Get information about the document collection."""
     logger.debug("Collection info requested")
 
     try:
+        from app.core.vector_store import VectorStoreService
+
         vector_store = VectorStoreService(cfg=cfg)
         info = vector_store.get_collection_info()
 
@@ -124,13 +126,15 @@ async def get_collection_info(
     description="Delete all the documents form the vector store"
 )
 async def delete_collection(
-      cfg: DictConfig = Depends(get_cfg),
+      cfg: AppConfig = Depends(get_cfg),
 ) -> dict:
 
     """Delete the entire document collection."""
     logger.warning("Collection deletion requested")
 
     try:
+        from app.core.vector_store import VectorStoreService
+
         vector_store = VectorStoreService(cfg)
         vector_store.delete_collection()
 
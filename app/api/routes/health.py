@@ -6,7 +6,6 @@ from fastapi import APIRouter, HTTPException
 
 from app import __version__
 from app.dto.health_schema import HealthResponse, ReadinessResponse
-from app.core.vector_store import VectorStoreService
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
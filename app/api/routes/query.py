@@ -4,36 +4,61 @@ import time
 
 from fastapi import APIRouter, HTTPException
 from fastapi import Depends
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
-from omegaconf import DictConfig
+from app.dto.config import AppConfig
 
-from app.dto.error_schema import ErrorResponse
+from app.dto.error_schema import ErrorResponse, HTTPValidationError
 from app.dto.query_schema import (
     QueryRequest,
     QueryResponse,
-    SourceDocument
+    build_query_response,
+    dump_query_response,
 )
 from app.dto.evaluation_scores import EvaluationScores
-from app.core.vector_store import VectorStoreService
-from app.core.rag_chain import RagChain
 from app.utils.logger import get_logger
-from app.api.dependencies import get_cfg
+from app.api.dependencies import get_cfg, get_query_request
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/query", tags=["Query"])
 
+# The body is parsed by get_query_request rather than a QueryRequest body
+# parameter, so describe it in the OpenAPI schema explicitly.
+QUERY_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": QueryRequest.model_json_schema()},
+        },
+    },
+}
+
+# Errors raised while reading the body, which FastAPI no longer documents
+# on its own since there is no body parameter
+QUERY_REQUEST_ERRORS = {
+    413: {"model": ErrorResponse, "description": "Request body too large"},
+    422: {"model": HTTPValidationError, "description": "Validation Error"},
+}
+
 @router.post(
     "",
-    response_model=QueryResponse,
+    # The handler returns pre-serialized JSON, so skip FastAPI's response
+    # model pass and only document the shape for OpenAPI
+    response_model=None,
     responses={
+        200: {"model": QueryResponse, "description": "Successful Response"},
         400: {"model": ErrorResponse, "description": "Invalid request"},
+        **QUERY_REQUEST_ERRORS,
         500: {"model": ErrorResponse, "description": "Query processing error"},
     },
     summary="Ask a question",
     description="Submit a question and get an AI-generated answer based on the ingested documents.",
+    openapi_extra=QUERY_REQUEST_BODY,
 )
-async def query(request: QueryRequest,  cfg: DictConfig = Depends(get_cfg)) -> QueryResponse:
+async def query(
+    request: QueryRequest = Depends(get_query_request),
+    cfg: AppConfig = Depends(get_cfg),
+) -> Response:
     """Process a RAG query."""
     logger.info(
         f"Query received: {request.question[:100]}... "
@@ -43,6 +68,8 @@ async def query(request: QueryRequest,  cfg: DictConfig = Depends(get_cfg)) -> Q
     start_time = time.time()
 
     try:
+        from app.core.rag_chain import RagChain
+
         rag_chain = RagChain(cfg=cfg)
 
         if request.enable_evaluation:
@@ -52,30 +79,14 @@ async def query(request: QueryRequest,  cfg: DictConfig = Depends(get_cfg)) -> Q
                 include_sources=request.include_sources,
             )
 
-            sources = (
-                [
-                    SourceDocument(
-                        content=source["content"],
-                        metadata=source["metadata"],
-                    )
-                    for source in result["sources"]
-                ]
-                if request.include_sources
-                else None
-            )
+            sources = result["sources"] if request.include_sources else None
 
             answer = result["answer"]
             evaluation = EvaluationScores(**result["evaluation"])
 
         elif request.include_sources:
             result = await rag_chain.arun_with_sources(request.question)
-            sources = [
-                SourceDocument(
-                    content=source["content"],
-                    metadata=source["metadata"],
-                )
-                for source in result["sources"]
-            ]
+            sources = result["sources"]
             answer = result["answer"]
             evaluation = None
         else:
@@ -89,13 +100,17 @@ async def query(request: QueryRequest,  cfg: DictConfig = Depends(get_cfg)) -> Q
             f"Query processed in {processing_time:.2f}ms "
         )
 
-        return QueryResponse(
+        response = build_query_response(
             question=request.question,
             answer=answer,
             sources=sources,
             processing_time_ms=round(processing_time, 2),
             evaluation=evaluation,
+        )
 
+        return Response(
+            content=dump_query_response(response),
+            media_type="application/json",
         )
 
     except Exception as e:
@@ -110,16 +125,23 @@ async def query(request: QueryRequest,  cfg: DictConfig = Depends(get_cfg)) -> Q
     "/stream",
     responses={
         400: {"model": ErrorResponse, "description": "Invalid request"},
+        **QUERY_REQUEST_ERRORS,
         500: {"model": ErrorResponse, "description": "Query processing error"},
     },
     summary="Ask a question (streaming)",
     description="Submit a question and get a streaming AI-generated answer.",
+    openapi_extra=QUERY_REQUEST_BODY,
 )
-async def query_stream(request: QueryRequest,  cfg: DictConfig = Depends(get_cfg)) -> StreamingResponse:
+async def query_stream(
+    request: QueryRequest = Depends(get_query_request),
+    cfg: AppConfig = Depends(get_cfg),
+) -> StreamingResponse:
     """Process a RAG query with streaming response."""
     logger.info(f"Streaming query received: {request.question[:100]}...")
 
     try:
+        from app.core.rag_chain import RagChain
+
         rag_chain = RagChain(cfg=cfg)
 
         async def generate():
@@ -147,20 +169,23 @@ async def query_stream(request: QueryRequest,  cfg: DictConfig = Depends(get_cfg
 @router.post(
     "/search",
     responses={
+        **QUERY_REQUEST_ERRORS,
         500: {"model": ErrorResponse, "description": "Search error"},
     },
     summary="Search documents",
     description="Search for relevant documents without generating an answer.",
+    openapi_extra=QUERY_REQUEST_BODY,
 )
 async def search_documents(
-    request: QueryRequest,
-    cfg: DictConfig = Depends(get_cfg)
+    request: QueryRequest = Depends(get_query_request),
+    cfg: AppConfig = Depends(get_cfg)
 ) -> dict:
     """Search for relevant documents."""
     logger.info(f"Search received: {request.question[:100]}...")
 
     try:
-        
+        from app.core.vector_store import VectorStoreService
+
         vector_store = VectorStoreService(cfg=cfg)
         results = vector_store.search_with_scores(request.question)
 
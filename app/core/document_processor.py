@@ -12,16 +12,18 @@ from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from app.utils.logger import get_logger
-from omegaconf import DictConfig
+from app.dto.config import AppConfig
 
 logger = get_logger(__name__)
 
 
 class DocumentProcessor:
 
+    __slots__ = ("cfg", "chunk_size", "chunk_overlap", "text_splitter")
+
     SUPPORTED_EXTENSIONS = {".pdf", ".txt", ".csv"}
 
-    def __init__(self,cfg: DictConfig ):
+    def __init__(self,cfg: AppConfig ):
         self.cfg = cfg
         self.chunk_size = cfg.document_processing.chunk_size
         self.chunk_overlap = cfg.document_processing.chunk_overlap
@@ -119,7 +121,14 @@ class DocumentProcessor:
             ".csv": self.load_csv,
         }
 
-        return loaders[extension](file_path)
+        documents = loaders[extension](file_path)
+
+        # Tag each document so its metadata can be dispatched to the
+        # matching SourceMeta model without trying every variant
+        for doc in documents:
+            doc.metadata["source_type"] = extension.lstrip(".")
+
+        return documents
 
     def load_from_upload(
         self,
@@ -4,23 +4,27 @@ from functools import lru_cache
 from langchain_openai import OpenAIEmbeddings
 
 from app.utils.logger import get_logger
-from omegaconf import DictConfig
+from app.dto.config import AppConfig
 
 logger = get_logger(__name__)
 
-@lru_cache
-def get_embeddings(cfg: DictConfig) -> OpenAIEmbeddings:
+def get_embeddings(cfg: AppConfig) -> OpenAIEmbeddings:
     """Get cached OpenAI embeddings instance.
 
     Returns:
         Configured OpenAIEmbeddings instance
     """
+    return _get_embeddings(cfg.model.embedding_model, cfg.openai.api_key)
+
 
-    logger.info(f"Initializing embeddings model: {cfg.model.embedding_model}")
+@lru_cache
+def _get_embeddings(model: str, api_key: str) -> OpenAIEmbeddings:
+    # Keyed on the values used rather than the (unhashable) AppConfig
+    logger.info(f"Initializing embeddings model: {model}")
 
     embeddings = OpenAIEmbeddings(
-        model=cfg.model.embedding_model,
-        openai_api_key=cfg.openai.api_key,
+        model=model,
+        openai_api_key=api_key,
     )
     
     logger.info("OpenAI embeddings initialized successfully")
@@ -30,7 +34,7 @@ def get_embeddings(cfg: DictConfig) -> OpenAIEmbeddings:
 class EmbeddingService:
     """Service for generating embeddings."""
 
-    def __init__(self, cfg: DictConfig):
+    def __init__(self, cfg: AppConfig):
         """Initialize embedding service."""
         self.embeddings = get_embeddings(cfg)
         self.model_name = cfg.model.embedding_model
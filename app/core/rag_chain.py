@@ -10,7 +10,7 @@ from app.core.rag_evalutator import RAGEvaluator
 
 from app.core.rag_evalutator import evaluate
 from app.utils.logger import get_logger
-from omegaconf import DictConfig
+from app.dto.config import AppConfig
 
 logger = get_logger(__name__)
 
@@ -47,7 +47,17 @@ class RagChain:
     RAG Chain for QnA
     """
 
-    def __init__(self, cfg: DictConfig, vector_store_service: VectorStoreService | None = None):
+    __slots__ = (
+        "cfg",
+        "vector_store_service",
+        "retriever",
+        "evaluator",
+        "llm",
+        "prompt",
+        "chain",
+    )
+
+    def __init__(self, cfg: AppConfig, vector_store_service: VectorStoreService | None = None):
         
         """Initialize RAG chain.
 
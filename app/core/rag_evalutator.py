@@ -7,7 +7,7 @@ from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from ragas import evaluate
 from ragas.metrics import answer_relevancy, faithfulness
 
-from omegaconf import DictConfig
+from app.dto.config import AppConfig
 
 from app.utils.config_utils import get_config
 from app.utils.logger import get_logger
@@ -16,7 +16,9 @@ logger = get_logger(__name__)
 
 class RAGEvaluator:
 
-    def __init__(self, cfg: DictConfig):
+    __slots__ = ("cfg", "llm", "embeddings", "metrics")
+
+    def __init__(self, cfg: AppConfig):
 
         logger.info("Initialize RAG Evaluator")
         self.cfg = cfg
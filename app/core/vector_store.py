@@ -8,23 +8,28 @@ from qdrant_client import QdrantClient
 from qdrant_client.http.models import Distance, VectorParams
 from qdrant_client.http.exceptions import UnexpectedResponse
 from app.utils.logger import get_logger
-from omegaconf import DictConfig
+from app.dto.config import AppConfig
 from app.core.embeddings import get_embeddings
 
 logger = get_logger(__name__)
 
-@lru_cache
-def get_qdrant_client(cfg: DictConfig) -> QdrantClient:
+def get_qdrant_client(cfg: AppConfig) -> QdrantClient:
     """Get cached Qdrant client instance.
 
     Returns:
         Configured QdrantClient instance
     """
-    logger.info(f"Connecting to Qdrant at: {cfg.qdrant.url}")
+    return _get_qdrant_client(cfg.qdrant.url, cfg.qdrant.api_key)
+
+
+@lru_cache
+def _get_qdrant_client(url: str, api_key: str) -> QdrantClient:
+    # Keyed on the values used rather than the (unhashable) AppConfig
+    logger.info(f"Connecting to Qdrant at: {url}")
 
     client = QdrantClient(
-        url=cfg.qdrant.url,
-        api_key=cfg.qdrant.api_key,
+        url=url,
+        api_key=api_key,
     )
 
     logger.info("Qdrant client connected successfully")
@@ -33,7 +38,9 @@ def get_qdrant_client(cfg: DictConfig) -> QdrantClient:
 
 class VectorStoreService:
 
-    def __init__(self, cfg: DictConfig, collection_name: str | None = None):
+    __slots__ = ("cfg", "client", "collection_name", "embedding", "vector_store")
+
+    def __init__(self, cfg: AppConfig, collection_name: str | None = None):
         self.cfg = cfg
         self.client = get_qdrant_client(cfg)
         self.collection_name = collection_name or cfg.collection.name
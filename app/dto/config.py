@@ -23,6 +23,7 @@ class QdrantConfig:
 class CollectionConfig:
     """Collection configuration."""
     name: str = "ragit_documents"
+    embedding_dimension: int = 1536
 
 
 @dataclass
@@ -12,6 +12,20 @@ class ErrorResponse(BaseModel):
     detail: str | None = Field(None, description="Detailed error information")
 
 
+class ValidationErrorDetail(BaseModel):
+    """Single request validation error, as returned by FastAPI."""
+
+    loc: list[str | int] = Field(..., description="Location of the error")
+    msg: str = Field(..., description="Error message")
+    type: str = Field(..., description="Error type")
+
+
+class HTTPValidationError(BaseModel):
+    """Request validation error response (422)."""
+
+    detail: list[ValidationErrorDetail] = Field(..., description="Validation errors")
+
+
 class ValidationErrorResponse(BaseModel):
     """Validation error response."""
 
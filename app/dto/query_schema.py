@@ -1,7 +1,16 @@
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Annotated, Any, Literal, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+)
 
 from app.dto.evaluation_scores import EvaluationScores
 
@@ -37,28 +46,173 @@ class QueryRequest(BaseModel):
     }
 
 
-class SourceDocument(BaseModel):
+class PdfMeta(BaseModel):
+    """Metadata for a chunk loaded from a PDF file."""
+
+    model_config = ConfigDict(extra="allow")
+
+    source_type: Literal["pdf"] = "pdf"
+    source: str | None = Field(None, description="Document source/filename")
+    page: int | None = Field(None, description="Page number within the PDF")
+    total_pages: int | None = Field(None, description="Total pages in the PDF")
+
+
+class TxtMeta(BaseModel):
+    """Metadata for a chunk loaded from a text file."""
+
+    model_config = ConfigDict(extra="allow")
+
+    source_type: Literal["txt"] = "txt"
+    source: str | None = Field(None, description="Document source/filename")
+
+
+class CsvMeta(BaseModel):
+    """Metadata for a chunk loaded from a CSV file."""
+
+    model_config = ConfigDict(extra="allow")
+
+    source_type: Literal["csv"] = "csv"
+    source: str | None = Field(None, description="Document source/filename")
+    row: int | None = Field(None, description="Row number within the CSV")
+
+
+class GenericMeta(BaseModel):
+    """Metadata for a chunk of any other or unknown source type."""
+
+    model_config = ConfigDict(extra="allow")
+
+    # Untyped so any stored metadata validates; this is the fallback variant
+    source_type: Any = None
+    source: Any = Field(None, description="Document source/filename")
+
+
+_SOURCE_TYPES = {"pdf", "txt", "csv"}
+
+
+def _source_type(value: Any) -> str:
+    """Return the union tag for a metadata value.
+
+    Chunks ingested before ``source_type`` was recorded fall back to the
+    extension of their ``source`` filename. Anything that still doesn't
+    map to a known type is tagged ``generic`` and passed through as is.
+    """
+    if isinstance(value, dict):
+        source_type = value.get("source_type")
+        if source_type is None:
+            source_type = Path(str(value.get("source") or "")).suffix.lstrip(".").lower()
+    elif isinstance(value, GenericMeta):
+        # A fallback may carry a known source_type its typed variant rejected
+        return "generic"
+    else:
+        source_type = getattr(value, "source_type", None)
+    if isinstance(source_type, str) and source_type in _SOURCE_TYPES:
+        return source_type
+    return "generic"
+
+
+SourceMeta = Annotated[
+    Annotated[PdfMeta, Tag("pdf")]
+    | Annotated[TxtMeta, Tag("txt")]
+    | Annotated[CsvMeta, Tag("csv")]
+    | Annotated[GenericMeta, Tag("generic")],
+    Discriminator(_source_type),
+]
+
+_SOURCE_META_ADAPTER = TypeAdapter(SourceMeta)
+
+
+class SourceDocument(TypedDict):
     """Source document information."""
 
-    content: str = Field(..., description="Document content excerpt")
-    metadata: dict[str, Any] = Field(..., description="Document metadata")
+    content: Annotated[str, Field(description="Document content excerpt")]
+    metadata: Annotated[SourceMeta, Field(description="Document metadata")]
 
 
-class QueryResponse(BaseModel):
+class QueryResponse(TypedDict):
     """Response for RAG query."""
 
-    question: str = Field(..., description="Original question")
-    answer: str = Field(..., description="Generated answer")
-    sources: list[SourceDocument] | None = Field(
-        None,
-        description="Source documents used",
-    )
-    processing_time_ms: float = Field(
-        ...,
-        description="Query processing time in milliseconds",
-    )
-    evaluation: EvaluationScores | None = Field(
-        None,
-        description="RAGAS evaluation scores (if requested)",
+    question: Annotated[str, Field(description="Original question")]
+    answer: Annotated[str, Field(description="Generated answer")]
+    sources: Annotated[
+        list[SourceDocument] | None,
+        Field(description="Source documents used"),
+    ]
+    processing_time_ms: Annotated[
+        float,
+        Field(description="Query processing time in milliseconds"),
+    ]
+    evaluation: Annotated[
+        EvaluationScores | None,
+        Field(description="RAGAS evaluation scores (if requested)"),
+    ]
+
+
+# Built once at import and shared by every request.
+_RESP_ADAPTER = TypeAdapter(QueryResponse)
+
+
+def _validate_source_meta(metadata: dict[str, Any]) -> SourceMeta:
+    """Validate stored chunk metadata, falling back to GenericMeta.
+
+    A single chunk with unexpected field types (e.g. a non-integer page)
+    must not fail the whole query, so it is passed through untyped.
+    """
+    try:
+        return _SOURCE_META_ADAPTER.validate_python(metadata)
+    except ValidationError:
+        return GenericMeta.model_validate(metadata)
+
+
+def build_query_response(
+    question: str,
+    answer: str,
+    sources: list[dict[str, Any]] | None,
+    processing_time_ms: float,
+    evaluation: EvaluationScores | None = None,
+) -> QueryResponse:
+    """Build a response from trusted, server-generated data.
+
+    Args:
+        question: Validated question echoed back to the client
+        answer: Answer produced by the RAG chain
+        sources: Source dicts with ``content`` and ``metadata`` keys
+        processing_time_ms: Measured processing time in milliseconds
+        evaluation: Optional RAGAS evaluation scores
+
+    Returns:
+        QueryResponse dict
+    """
+    # Only the source metadata is validated (through the tagged union above),
+    # so pass only server-produced data; client input must be validated first,
+    # as QueryRequest is.
+    return QueryResponse(
+        question=question,
+        answer=answer,
+        sources=(
+            [
+                SourceDocument(
+                    content=source["content"],
+                    metadata=_validate_source_meta(source["metadata"]),
+                )
+                for source in sources
+            ]
+            if sources is not None
+            else None
+        ),
+        processing_time_ms=processing_time_ms,
+        evaluation=evaluation,
     )
-    
\ No newline at end of file
+
+
+def dump_query_response(response: QueryResponse) -> bytes:
+    """Serialize a QueryResponse to JSON bytes.
+
+    Args:
+        response: Response built by build_query_response
+
+    Returns:
+        JSON-encoded response body
+    """
+    # exclude_unset keeps source metadata exactly as stored, without the
+    # defaults of the typed SourceMeta variants
+    return _RESP_ADAPTER.dump_json(response, exclude_unset=True)
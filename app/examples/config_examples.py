@@ -1,12 +1,23 @@
 """Example usage of Hydra configuration with decorators."""
 
 import os
+import sys
 
 import hydra
 from omegaconf import DictConfig
 
-from app.dto.config import register_configs
-from app.utils.config_utils import print_config, validate_config, with_config
+from app.dto.config import AppConfig, register_configs
+from app.utils.config_utils import (
+    get_raw_config,
+    print_config,
+    validate_config,
+    with_config,
+)
+
+
+def _emit(lines: list[str]) -> None:
+    """Write buffered example output to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def setup_test_env():
@@ -44,54 +55,58 @@ def example_hydra_main(cfg: DictConfig) -> None:
         # Show configuration
         python -m app.examples.config_examples --cfg job
     """
-    print("=" * 70)
-    print("Example 1: Using @hydra.main Decorator")
-    print("=" * 70)
-    print()
+    lines: list[str] = []
+    out = lines.append
+
+    out("=" * 70)
+    out("Example 1: Using @hydra.main Decorator")
+    out("=" * 70)
+    out("")
     
     # Validate configuration
-    print("🔍 Validating configuration...")
+    out("🔍 Validating configuration...")
     validate_config(cfg)
-    print("✅ Configuration is valid!")
-    print()
+    out("✅ Configuration is valid!")
+    out("")
     
     # Access configuration values
-    print("📋 Configuration Values:")
-    print(f"  App Name: {cfg.app_name}")
-    print(f"  App Version: {cfg.app_version}")
-    print(f"  LLM Model: {cfg.model.llm_model}")
-    print(f"  Embedding Model: {cfg.model.embedding_model}")
-    print(f"  Temperature: {cfg.model.llm_temperature}")
-    print(f"  Chunk Size: {cfg.document_processing.chunk_size}")
-    print(f"  Chunk Overlap: {cfg.document_processing.chunk_overlap}")
-    print(f"  Retrieval K: {cfg.retrieval.k}")
-    print(f"  Collection: {cfg.collection.name}")
-    print()
+    out("📋 Configuration Values:")
+    out(f"  App Name: {cfg.app_name}")
+    out(f"  App Version: {cfg.app_version}")
+    out(f"  LLM Model: {cfg.model.llm_model}")
+    out(f"  Embedding Model: {cfg.model.embedding_model}")
+    out(f"  Temperature: {cfg.model.llm_temperature}")
+    out(f"  Chunk Size: {cfg.document_processing.chunk_size}")
+    out(f"  Chunk Overlap: {cfg.document_processing.chunk_overlap}")
+    out(f"  Retrieval K: {cfg.retrieval.k}")
+    out(f"  Collection: {cfg.collection.name}")
+    out("")
     
     # Access nested configuration
-    print("🔐 API Configuration:")
-    print(f"  OpenAI API Key: {cfg.openai.api_key[:20]}...")
-    print(f"  Qdrant URL: {cfg.qdrant.url}")
-    print(f"  Qdrant API Key: {cfg.qdrant.api_key[:20]}...")
-    print()
+    out("🔐 API Configuration:")
+    out(f"  OpenAI API Key: {cfg.openai.api_key[:20]}...")
+    out(f"  Qdrant URL: {cfg.qdrant.url}")
+    out(f"  Qdrant API Key: {cfg.qdrant.api_key[:20]}...")
+    out("")
     
-    print("🌐 API Server Configuration:")
-    print(f"  Host: {cfg.api.host}")
-    print(f"  Port: {cfg.api.port}")
-    print()
+    out("🌐 API Server Configuration:")
+    out(f"  Host: {cfg.api.host}")
+    out(f"  Port: {cfg.api.port}")
+    out("")
     
-    print("📊 RAGAS Evaluation:")
-    print(f"  Enabled: {cfg.ragas.enable_evaluation}")
-    print(f"  Timeout: {cfg.ragas.timeout_seconds}s")
-    print(f"  Log Results: {cfg.ragas.log_results}")
-    print()
+    out("📊 RAGAS Evaluation:")
+    out(f"  Enabled: {cfg.ragas.enable_evaluation}")
+    out(f"  Timeout: {cfg.ragas.timeout_seconds}s")
+    out(f"  Log Results: {cfg.ragas.log_results}")
+    out("")
+    _emit(lines)
 
 
 # ============================================================================
 # Example 2: Using @with_config decorator (Best for internal functions)
 # ============================================================================
 @with_config
-def example_with_config_decorator(cfg: DictConfig) -> None:
+def example_with_config_decorator(cfg: AppConfig) -> None:
     """
     Example using custom @with_config decorator.
     
@@ -103,17 +118,21 @@ def example_with_config_decorator(cfg: DictConfig) -> None:
     - Good for helper functions and utilities
     - Config is automatically injected
     """
-    print("=" * 70)
-    print("Example 2: Using @with_config Decorator")
-    print("=" * 70)
-    print()
+    lines: list[str] = []
+    out = lines.append
+
+    out("=" * 70)
+    out("Example 2: Using @with_config Decorator")
+    out("=" * 70)
+    out("")
     
-    print("📋 Basic Configuration Access:")
-    print(f"  App Name: {cfg.app_name}")
-    print(f"  LLM Model: {cfg.model.llm_model}")
-    print(f"  Temperature: {cfg.model.llm_temperature}")
-    print(f"  Chunk Size: {cfg.document_processing.chunk_size}")
-    print()
+    out("📋 Basic Configuration Access:")
+    out(f"  App Name: {cfg.app_name}")
+    out(f"  LLM Model: {cfg.model.llm_model}")
+    out(f"  Temperature: {cfg.model.llm_temperature}")
+    out(f"  Chunk Size: {cfg.document_processing.chunk_size}")
+    out("")
+    _emit(lines)
 
 
 # ============================================================================
@@ -121,8 +140,10 @@ def example_with_config_decorator(cfg: DictConfig) -> None:
 # ============================================================================
 class ConfigurableService:
     """Example service class that uses Hydra configuration."""
+
+    __slots__ = ("cfg", "llm_model", "embedding_model", "chunk_size", "retrieval_k")
     
-    def __init__(self, cfg: DictConfig):
+    def __init__(self, cfg: AppConfig):
         """Initialize service with configuration."""
         self.cfg = cfg
         self.llm_model = cfg.model.llm_model
@@ -141,12 +162,15 @@ class ConfigurableService:
 
 
 @with_config
-def example_class_with_config(cfg: DictConfig) -> None:
+def example_class_with_config(cfg: AppConfig) -> None:
     """Example showing how to use config with a class."""
-    print("=" * 70)
-    print("Example 3: Using Config in a Class")
-    print("=" * 70)
-    print()
+    lines: list[str] = []
+    out = lines.append
+
+    out("=" * 70)
+    out("Example 3: Using Config in a Class")
+    out("=" * 70)
+    out("")
     
     # Create service with config
     service = ConfigurableService(cfg)
@@ -154,10 +178,11 @@ def example_class_with_config(cfg: DictConfig) -> None:
     # Get service info
     info = service.get_info()
     
-    print("🔧 Service Configuration:")
+    out("🔧 Service Configuration:")
     for key, value in info.items():
-        print(f"  {key}: {value}")
-    print()
+        out(f"  {key}: {value}")
+    out("")
+    _emit(lines)
 
 
 # ============================================================================
@@ -174,10 +199,13 @@ def example_programmatic_access() -> None:
     """
     from app.utils.config_utils import get_config
     
-    print("=" * 70)
-    print("Example 4: Programmatic Config Access")
-    print("=" * 70)
-    print()
+    lines: list[str] = []
+    out = lines.append
+
+    out("=" * 70)
+    out("Example 4: Programmatic Config Access")
+    out("=" * 70)
+    out("")
     
     # Load config with overrides
     cfg = get_config(overrides=(
@@ -187,33 +215,40 @@ def example_programmatic_access() -> None:
         "document_processing.chunk_size=500",
     ))
     
-    print("🔄 Overridden Configuration:")
-    print(f"  LLM Model: {cfg.model.llm_model}")
-    print(f"  Temperature: {cfg.model.llm_temperature}")
-    print(f"  Retrieval K: {cfg.retrieval.k}")
-    print(f"  Chunk Size: {cfg.document_processing.chunk_size}")
-    print()
+    out("🔄 Overridden Configuration:")
+    out(f"  LLM Model: {cfg.model.llm_model}")
+    out(f"  Temperature: {cfg.model.llm_temperature}")
+    out(f"  Retrieval K: {cfg.retrieval.k}")
+    out(f"  Chunk Size: {cfg.document_processing.chunk_size}")
+    out("")
+    _emit(lines)
 
 
 # ============================================================================
 # Example 5: Print full configuration
 # ============================================================================
-@with_config
-def example_print_config(cfg: DictConfig) -> None:
-    """Example showing how to print the full configuration."""
-    print("=" * 70)
-    print("Example 5: Print Full Configuration")
-    print("=" * 70)
-    print()
-    print_config(cfg)
+def example_print_config() -> None:
+    """
+    Example showing how to print the full configuration.
+
+    Prints the raw DictConfig so env-backed secrets stay as
+    ``${oc.env:...}`` placeholders instead of their resolved values.
+    """
+    lines: list[str] = []
+    out = lines.append
+
+    out("=" * 70)
+    out("Example 5: Print Full Configuration")
+    out("=" * 70)
+    out("")
+    _emit(lines)
+    print_config(get_raw_config())
 
 
 # ============================================================================
 # Main entry point
 # ============================================================================
 if __name__ == "__main__":
-    import sys
-    
     # Set up test environment
     setup_test_env()
     
@@ -223,11 +258,11 @@ if __name__ == "__main__":
     # If CLI arguments are provided, use @hydra.main decorator
     # This allows CLI overrides like: python script.py model.llm_model=gpt-4
     if len(sys.argv) > 1:
-        print("\n🚀 Running with @hydra.main (supports CLI overrides)\n")
+        _emit(["\n🚀 Running with @hydra.main (supports CLI overrides)\n"])
         example_hydra_main()
     else:
         # Otherwise, run all examples
-        print("\n🚀 Running All Hydra Configuration Examples\n")
+        _emit(["\n🚀 Running All Hydra Configuration Examples\n"])
         
         # Example 2: Custom decorator
         example_with_config_decorator()
@@ -241,12 +276,16 @@ if __name__ == "__main__":
         # Example 5: Print full config
         example_print_config()
         
-        print("=" * 70)
-        print("✅ All examples completed!")
-        print("=" * 70)
-        print()
-        print("💡 Try running with CLI overrides:")
-        print("   python -m app.examples.config_examples model.llm_model=gpt-4")
-        print("   python -m app.examples.config_examples model.llm_model=gpt-4 retrieval.k=10")
-        print("   python -m app.examples.config_examples --cfg job")
-        print()
+        lines: list[str] = []
+        out = lines.append
+
+        out("=" * 70)
+        out("✅ All examples completed!")
+        out("=" * 70)
+        out("")
+        out("💡 Try running with CLI overrides:")
+        out("   python -m app.examples.config_examples model.llm_model=gpt-4")
+        out("   python -m app.examples.config_examples model.llm_model=gpt-4 retrieval.k=10")
+        out("   python -m app.examples.config_examples --cfg job")
+        out("")
+        _emit(lines)
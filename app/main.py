@@ -3,32 +3,59 @@
 # IMPORTANT: Load .env file FIRST, before any LangChain imports
 # This ensures LangSmith environment variables are available for tracing
 # ruff: noqa: E402, I001
+import os
+
 from dotenv import load_dotenv
 
-load_dotenv()
+# Workers inherit the environment from the parent process, so only the
+# first process needs to parse .env
+if not os.getenv("QNA_ENV_LOADED"):
+    load_dotenv()
+    os.environ["QNA_ENV_LOADED"] = "1"
 
 from contextlib import asynccontextmanager
 
+import orjson
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 
 from app import __version__
 from app.api.routes import health, documents, query
-from omegaconf import DictConfig
+from app.api.body_limit import (
+    PayloadTooLargeError,
+    QueryBodySizeLimitMiddleware,
+    payload_too_large_response,
+)
 from app.utils.logger import get_logger, setup_logging
-from app.utils.config_utils import with_config
+from app.utils.config_utils import get_config
+
+logger = get_logger(__name__)
 
-@with_config
 @asynccontextmanager
-async def lifespan(cfg:DictConfig, app:FastAPI):
+async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
-    
+    cfg = get_config()
+
+    # Import the LangChain/Qdrant/OpenAI stack here rather than at module
+    # import, so each worker loads it once after it has started. Route
+    # handlers import these lazily and hit the already-populated modules.
+    from app.core import document_processor, rag_chain  # noqa: F401
+
     # store cfg globally on app.state
     app.state.cfg = cfg
     setup_logging(log_level=cfg.logging.level)
-    logger = get_logger(__name__)
+
+    # The root payload only depends on startup config, so encode it once
+    app.state.root_bytes = orjson.dumps({
+        "message": f"Welcome to {cfg.app_name}",
+        "version": __version__,
+        "docs": "/docs",
+        "redoc": "/redoc"
+    })
+
     logger.info(f"Starting {cfg.app_name} v{__version__}")
     logger.info(f"Log level: {cfg.logging.level}")
 
@@ -60,17 +87,31 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 
-# Add CORS middleware
+# Reject oversized /query bodies before they reach validation
+app.add_middleware(QueryBodySizeLimitMiddleware)
+
+
+@app.exception_handler(PayloadTooLargeError)
+async def payload_too_large_handler(request: Request, exc: PayloadTooLargeError):
+    """Return the same 413 body as QueryBodySizeLimitMiddleware."""
+    return payload_too_large_response()
+
+
+# Add CORS middleware (added last so it wraps the size guard)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
+    # The API uses no cookies or auth headers. Credentialed wildcard CORS
+    # would make Starlette echo and rebuild the Origin header per request.
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[],
 )
 
 app.include_router(health.router)
@@ -80,24 +121,55 @@ app.include_router(query.router)
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint."""
+    return Response(content=app.state.root_bytes, media_type="application/json")
+
+
+@app.exception_handler(TimeoutError)
+async def timeout_exception_handler(request: Request, exc: TimeoutError):
+    """Handle timeouts without a traceback.
+
+    Registered for the specific type so it is handled by ExceptionMiddleware
+    and never reaches ServerErrorMiddleware, which would re-raise it and
+    have the server log the full traceback.
+    """
+    logger.warning(
+        "Request timed out: method=%s path=%s error=%s",
+        request.method,
+        request.url.path,
+        exc,
+        extra={
+            "method": request.method,
+            "path": request.url.path,
+            "error_type": type(exc).__name__,
+        },
+    )
 
-    cfg = app.state.cfg
-
-    return {
-        "message": f"Welcome to {cfg.app_name}",
-        "version": __version__,
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": "Internal Server Error",
+            "message": str(exc),
+        },
+    )
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
-    logger = get_logger(__name__)
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error(
+        "Unhandled exception: method=%s path=%s error=%s",
+        request.method,
+        request.url.path,
+        exc,
+        exc_info=exc,
+        extra={
+            "method": request.method,
+            "path": request.url.path,
+            "error_type": type(exc).__name__,
+        },
+    )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -109,9 +181,11 @@ async def global_exception_handler(request: Request, exc: Exception):
 if __name__ == "__main__":
     import uvicorn
 
+    cfg = get_config()
+
     uvicorn.run(
         "app.main:app",
-        host=settings.api_host,
-        port=settings.api_port,
+        host=cfg.api.host,
+        port=cfg.api.port,
         reload=True,
     )
@@ -1,7 +1,7 @@
 """Hydra configuration utilities and helpers."""
 
-from typing import Any, Callable, TypeVar, cast
-from functools import lru_cache, wraps
+from typing import Any, Callable, Iterable, TypeVar, cast
+from functools import wraps
 from pathlib import Path
 
 from hydra import compose, initialize_config_dir
@@ -12,41 +12,94 @@ from app.dto.config import AppConfig, register_configs
 T = TypeVar("T")
 
 
-@lru_cache
-def get_config(overrides: tuple[str, ...] = ()) -> DictConfig:
+_REGISTERED = False
+
+
+def _ensure_registered() -> None:
+    """Register the config schema with Hydra's ConfigStore once per process."""
+    global _REGISTERED
+    if not _REGISTERED:
+        register_configs()
+        _REGISTERED = True
+
+
+_RAW_CFG_CACHE: dict[tuple[str, ...], DictConfig] = {}
+_CFG_CACHE: dict[tuple[str, ...], AppConfig] = {}
+
+
+def get_raw_config(overrides: Iterable[str] = ()) -> DictConfig:
     """
-    Get Hydra configuration.
+    Get the composed Hydra configuration as a DictConfig.
+
+    Each distinct set of overrides is composed once and cached in its own
+    slot, so loading an overridden config never evicts the default one.
+    Prefer get_config() unless OmegaConf features are needed.
 
     Args:
-        overrides: Tuple of override strings (e.g., ("model.llm_model=gpt-4",))
+        overrides: Override strings (e.g., ("model.llm_model=gpt-4",))
 
     Returns:
         DictConfig: Hydra configuration object
+    """
+    overrides = list(overrides)
+    # Hydra applies overrides in order, so the order is part of the key
+    key = tuple(overrides)
+
+    cfg = _RAW_CFG_CACHE.get(key)
+    if cfg is None:
+        _ensure_registered()
+        config_dir = str(Path(__file__).parent.parent / "conf")
+
+        with initialize_config_dir(config_dir=config_dir, version_base="1.3"):
+            cfg = compose(config_name="config", overrides=overrides)
+
+        _RAW_CFG_CACHE[key] = cfg
+
+    return cfg
+
+
+def get_config(overrides: Iterable[str] = ()) -> AppConfig:
+    """
+    Get Hydra configuration as a typed AppConfig.
+
+    The composed config is resolved and converted to plain dataclasses
+    once, so attribute access afterwards skips OmegaConf entirely.
+
+    Args:
+        overrides: Override strings (e.g., ("model.llm_model=gpt-4",))
+
+    Returns:
+        AppConfig: Structured configuration object
 
     Example:
         >>> cfg = get_config()
         >>> print(cfg.openai.api_key)
-        >>> cfg = get_config(overrides=("model.llm_model=gpt-4",))
+        >>> cfg = get_config(overrides=["model.llm_model=gpt-4"])
     """
-    register_configs()
-    config_dir = str(Path(__file__).parent.parent / "conf")
+    overrides = list(overrides)
+    key = tuple(overrides)
 
-    with initialize_config_dir(config_dir=config_dir, version_base="1.3"):
-        cfg = compose(config_name="config", overrides=list(overrides))
+    cfg = _CFG_CACHE.get(key)
+    if cfg is None:
+        cfg = validate_config(get_raw_config(overrides))
+        _CFG_CACHE[key] = cfg
 
     return cfg
 
 
-
 def print_config(cfg: DictConfig | AppConfig | None = None) -> None:
     """
     Pretty print configuration.
 
+    Pass the raw DictConfig (the default) to keep ``${oc.env:...}``
+    placeholders unresolved. An AppConfig has its env values resolved, so
+    printing one writes secrets such as API keys to stdout.
+
     Args:
-        cfg: Configuration object to print (defaults to current config)
+        cfg: Configuration object to print (defaults to the raw config)
     """
     if cfg is None:
-        cfg = get_config()
+        cfg = get_raw_config()
 
     if isinstance(cfg, DictConfig):
         print(OmegaConf.to_yaml(cfg))
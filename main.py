@@ -1,6 +1,6 @@
 from app.core.document_processor import DocumentProcessor
-from omegaconf import DictConfig
-from app.utils.config_utils import with_config, print_config
+from app.dto.config import AppConfig
+from app.utils.config_utils import get_raw_config, with_config, print_config
 from app.utils.logger import setup_logging
 from app.core.vector_store import VectorStoreService
 from app.core.rag_chain import RagChain
@@ -11,8 +11,8 @@ from dotenv import load_dotenv
 load_dotenv()
 
 @with_config
-def main(cfg: DictConfig):
-    print_config(cfg)
+def main(cfg: AppConfig):
+    print_config(get_raw_config())
 
     setup_logging(log_level=cfg.logging.level)
 
@@ -39,8 +39,8 @@ def main(cfg: DictConfig):
 
 
 @with_config
-async def amain(cfg: DictConfig):
-    print_config(cfg)
+async def amain(cfg: AppConfig):
+    print_config(get_raw_config())
 
     setup_logging(log_level=cfg.logging.level)
 
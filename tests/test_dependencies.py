@@ -0,0 +1,44 @@
+"""Tests for the query request body dependency."""
+
+import unittest
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_query_request
+from app.dto.query_schema import QueryRequest
+
+app = FastAPI()
+
+
+@app.post("/query")
+async def query(request: QueryRequest = Depends(get_query_request)) -> dict:
+    return request.model_dump()
+
+
+class GetQueryRequestTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = TestClient(app)
+
+    def test_valid_body(self) -> None:
+        response = self.client.post("/query", content=b'{"question": "What is RAG?"}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["question"], "What is RAG?")
+
+    def test_invalid_field_returns_422(self) -> None:
+        response = self.client.post("/query", content=b'{"question": ""}')
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["loc"], ["body", "question"])
+
+    def test_non_utf8_body_returns_422(self) -> None:
+        response = self.client.post("/query", content=b"\xff\xfe")
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["type"], "json_invalid")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Tests for query response building and serialization."""
+
+import json
+import unittest
+
+from app.dto.query_schema import build_query_response, dump_query_response
+
+
+def dump_metadata(metadata: dict) -> dict:
+    response = build_query_response(
+        question="q",
+        answer="a",
+        sources=[{"content": "c", "metadata": metadata}],
+        processing_time_ms=1.0,
+    )
+    return json.loads(dump_query_response(response))["sources"][0]["metadata"]
+
+
+class SourceMetadataTest(unittest.TestCase):
+
+    def test_metadata_is_returned_as_stored(self) -> None:
+        for metadata in (
+            {},
+            {"source": "f.pdf", "page": 1},
+            {"source": "f.csv", "source_type": "csv"},
+            {"source": "f.txt", "source_type": "txt", "_id": "abc"},
+        ):
+            with self.subTest(metadata=metadata):
+                self.assertEqual(dump_metadata(metadata), metadata)
+
+    def test_invalid_typed_fields_fall_back(self) -> None:
+        for metadata in (
+            {"source": "a.pdf", "page": "iv"},
+            {"source_type": 7},
+            {"source": "notes.docx"},
+        ):
+            with self.subTest(metadata=metadata):
+                self.assertEqual(dump_metadata(metadata), metadata)
+
+
+if __name__ == "__main__":
+    unittest.main()